@@ -0,0 +1,5 @@
+"""
+Constants shared by the test cases
+"""
+
+BASE_URL = "/products"
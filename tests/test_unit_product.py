@@ -0,0 +1,146 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test cases for Product Model logic that does not need a database
+
+Test cases can be run with:
+    pytest tests/test_unit_product.py
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+import pytest
+from service.models import Product, Category, DataValidationError
+
+# expected prices, parsed once when the module is loaded
+PRICE_LAPTOP = Decimal("1200.50")
+PRICE_PHONE = Decimal("999.99")
+
+
+######################################################################
+#  P R O D U C T   M O D E L   T E S T   C A S E S
+######################################################################
+def test_create_a_product():
+    """It should Create a product and assert that it exists"""
+    product = Product(name="Fedora", description="A red hat", price=12.50, available=True, category=Category.CLOTHS)
+    assert str(product) == "<Product Fedora id=[None]>"
+    assert product is not None
+    assert product.id is None
+    assert product.name == "Fedora"
+    assert product.description == "A red hat"
+    assert product.available is True
+    assert product.price == 12.50
+    assert product.category == Category.CLOTHS
+
+
+def test_deserialize_success(fresh_product):
+    """ Successfully deserialize a valid product dict """
+    data = {
+        "name": "Laptop",
+        "description": "Gaming laptop",
+        "price": "1200.50",
+        "available": True,
+        "category": "AUTOMOTIVE"
+    }
+    product = fresh_product.deserialize(data)
+    assert product.name == "Laptop"
+    assert product.description == "Gaming laptop"
+    assert product.price == PRICE_LAPTOP
+    assert product.available is True
+    assert product.category == Category.AUTOMOTIVE
+
+
+@pytest.mark.parametrize(
+    "bad_data",
+    [
+        pytest.param(None, id="none_input"),
+        pytest.param(
+            {
+                # "name": "Laptop",   # Missing!
+                "description": "Gaming laptop",
+                "price": "1200.50",
+                "available": True,
+                "category": "ELECTRONICS"
+            },
+            id="missing_field",
+        ),
+        pytest.param(
+            {
+                "name": "Laptop",
+                "description": "Gaming laptop",
+                "price": "1200.50",
+                "available": "True",   # ❌ string instead of bool
+                "category": "ELECTRONICS"
+            },
+            id="invalid_boolean_type",
+        ),
+        pytest.param(
+            {
+                "name": "Laptop",
+                "description": "Gaming laptop",
+                "price": "1200.50",
+                "available": True,
+                "category": "NON_EXISTENT"  # ❌ not in Category enum
+            },
+            id="invalid_category",
+        ),
+    ],
+)
+def test_deserialize_invalid(fresh_product, bad_data):
+    """ Bad or missing data should raise DataValidationError """
+    with pytest.raises(DataValidationError):
+        fresh_product.deserialize(bad_data)
+
+
+def test_deserialize_price_as_decimal(fresh_product):
+    """ Ensure price is converted to Decimal """
+    data = {
+        "name": "Phone",
+        "description": "Smartphone",
+        "price": "999.99",
+        "available": False,
+        "category": "AUTOMOTIVE"
+    }
+    product = fresh_product.deserialize(data)
+    assert isinstance(product.price, Decimal)
+    assert product.price == PRICE_PHONE
+
+
+######################################################################
+#  F I N D   B Y   P R I C E   T E S T   C A S E S
+######################################################################
+PRICE_DECIMAL = Decimal("19.99")
+
+
+@pytest.mark.parametrize(
+    "price",
+    [
+        pytest.param(PRICE_DECIMAL, id="decimal"),
+        pytest.param("19.99", id="string"),
+        pytest.param(' "19.99" ', id="extra_quotes_in_string"),
+    ],
+)
+def test_find_by_price(monkeypatch, price):
+    """ find_by_price should filter on the price converted to a Decimal """
+    calls = []
+    query = SimpleNamespace(filter=lambda expr: calls.append(expr) or expr)
+    monkeypatch.setattr(Product, "query", query)
+
+    result = Product.find_by_price(price)
+
+    # check filter was called once
+    assert len(calls) == 1
+    # right-hand side of SQLAlchemy expression should equal Decimal
+    assert calls[0].right.value == PRICE_DECIMAL
+    assert result is calls[0]